@@ -51,7 +51,11 @@ class MyAlgorithm(Algorithm[MyState]):
     # Optional class variables for metadata (appear in traces and viewer)
     # algorithm_name: Optional[str] = "My Algorithm"  # defaults to class name if not set
     # algorithm_description: Optional[str] = None  # defaults to the description in docstring if not set
-    
+
+    # Optional flag to gate diagnostic output (see LearnGraphAlgorithm).
+    # Avoid unconditional print() calls in on_event: it runs once per event.
+    # is_verbose: bool = False
+
     #
     # Mandatory method: given a process id, create and return the initial state of that process.
     #
@@ -122,15 +122,7 @@ class LearnGraphAlgorithm(Algorithm[LearnState]):
         
         match event:
             
-            # () when Start() is received do
-            # (5)     if (not part_i) then start() end if            
-            case Start(_):
-                if not old_state.part_i:
-                    return self._do_start(old_state)
-                else:
-                    # do nothing
-                    return old_state, []
-                
+            # PositionMsg is by far the most frequent event, so it is matched first.
             # () when Position(id, neighbors) is received from neighbor id_x do
             case PositionMsg(_, id_x, id, neighbors):
                 new_state = old_state
@@ -154,11 +146,12 @@ class LearnGraphAlgorithm(Algorithm[LearnState]):
                     # (11)  send POSITION(id, neighbors) to id_y
                     # (12) end for
                     # send the position to all neighbors except the sender
-                    new_events = new_events + [
-                        PositionMsg(target=neighbor, sender=old_state.pid, origin=id, neighbors=neighbors)
+                    pid = old_state.pid
+                    new_events.extend(
+                        PositionMsg(target=neighbor, sender=pid, origin=id, neighbors=neighbors)
                         for neighbor in old_state.neighbors_i
                         if neighbor != id_x
-                    ]
+                    )
                     # (13) if forall<id_j, id_k> in channels_known_i : {id_j, id_k} in proc_known_i) then
                     # (14)    p_i knowns the communication graph
                     # (15) end if
@@ -171,11 +164,20 @@ class LearnGraphAlgorithm(Algorithm[LearnState]):
                 # return the new states and all send events
                 return new_state, new_events
             
+            # () when Start() is received do
+            # (5)     if (not part_i) then start() end if            
+            case Start(_):
+                if not old_state.part_i:
+                    return self._do_start(old_state)
+                else:
+                    # do nothing
+                    return old_state, ()
+                
             case GraphIsKnown(_):
                 # Handle the graph known event
                 if self.is_verbose:
                     print(f"Graph is known for {old_state.pid}")
-                return old_state, []
+                return old_state, ()
             
             case _:
                 # Handle other events
@@ -203,13 +205,14 @@ class LearnGraphAlgorithm(Algorithm[LearnState]):
         Returns:
             A tuple of (updated_state, list_of_position_messages) to send.
         """
+        pid, neighbors = state.pid, state.neighbors_i
         events = [
-            PositionMsg(target=neighbor, sender=state.pid, origin=state.pid, neighbors=state.neighbors_i)
-            for neighbor in state.neighbors_i
+            PositionMsg(target=neighbor, sender=pid, origin=pid, neighbors=neighbors)
+            for neighbor in neighbors
         ]
         state = state.cloned_with(
-            proc_known_i=ProcessSet(state.pid),
-            channels_known_i=ChannelSet( Channel(state.pid, neighbor) for neighbor in state.neighbors_i ),
+            proc_known_i=ProcessSet(pid),
+            channels_known_i=ChannelSet( Channel(pid, neighbor) for neighbor in neighbors ),
             part_i=True, # part_i <- true
         )
         return state, events
@@ -24,6 +24,7 @@ The core components include:
 - `.system`:
     - `.system.System`: Represents the distributed system model, including its topology and synchrony model.
     - `.system.SimTime`: Type alias representing simulation time.
+    - `.system.RandomSource`: Protocol of the random number generators used by synchrony models.
     - `.system.SynchronyModel`: Base class to represents a model of synchrony.
         - `.system.Synchronous`: Represents a **synchronous** model (fixed message delays).
         - `.system.Asynchronous`: Represents an **asynchronous** model (unpredictable delays).
@@ -86,6 +87,7 @@ from .pid import ProcessSet as ProcessSet
 from .state import State as State
 from .system import Asynchronous as Asynchronous
 from .system import PartiallySynchronous as PartiallySynchronous
+from .system import RandomSource as RandomSource
 from .system import SimTime as SimTime
 from .system import simtime as simtime
 from .system import StochasticExponential as StochasticExponential
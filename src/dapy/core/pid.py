@@ -1,25 +1,59 @@
 # Copyright (c) 2025-2026 Xavier Defago
 # SPDX-License-Identifier: MIT
 
+import inspect
+
 from dataclasses import dataclass, field
-from typing import Iterable, Iterator, Self
+from typing import Any, Iterable, Iterator, Self, cast
+
+# Process identifiers below this bound are interned, so that Pid(3) is Pid(3)
+_PID_CACHE_SIZE = 4096
+_pid_cache: dict[int, 'Pid'] = {}
+
+# Marks the argument-less call to Pid.__new__ made when unpickling traces saved before interning
+_NO_ID: Any = object()
 
 
 @dataclass(frozen=True, order=True, init=False)
 class Pid:
     """Represents a unique process identifier in a distributed system.
     
+    Like small integers, instances with small identifiers are interned:
+    creating the same Pid again returns the existing instance.
+    
     Attributes:
         id: The unique numeric identifier for the process.
     """
     id: int
     
-    def __init__(self, id: int | Self) -> None:
+    def __new__(cls, id: int | Self = _NO_ID) -> Self:
+        if id is _NO_ID:
+            # Unpickling traces saved before interning calls __new__ without arguments
+            # and restores the attributes afterwards
+            return super().__new__(cls)
         if isinstance(id, Pid):
             id = id.id
+        # Only exact ints are interned, so that hash-equal values (True, 3.0, numpy
+        # integers) never end up as the id of the shared instance
+        interned = cls is Pid and type(id) is int
+        cached = _pid_cache.get(id) if interned else None
+        if cached is not None:
+            return cast(Self, cached)
         if id < 0:
             raise ValueError("Process ID must be a non-negative integer")
-        object.__setattr__(self, 'id', id)
+        pid = super().__new__(cls)
+        object.__setattr__(pid, 'id', id)
+        if interned and id < _PID_CACHE_SIZE:
+            _pid_cache[id] = pid
+        return pid
+    
+    def __init__(self, id: int | Self) -> None:
+        # Everything is done in __new__; requiring id here keeps Pid() an error
+        pass
+    
+    def __reduce__(self) -> tuple[type[Self], tuple[int]]:
+        # Recreate through the constructor, so that unpickled Pids are interned too
+        return (self.__class__, (self.id,))
 
     def __str__(self) -> str:
         return f"p{self.id}"
@@ -28,6 +62,12 @@ class Pid:
         return f"{self.__class__.__name__}({self.id})"
 
 
+# Document the constructor without the _NO_ID default, which only exists for unpickling
+Pid.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+    [inspect.Parameter('id', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int | Pid)]
+)
+
+
 @dataclass(frozen=True)
 class ProcessSet:
     """Represents an immutable set of process identifiers.
@@ -64,9 +104,9 @@ class ProcessSet:
     
     def __add__(self, other: Self | Pid | Iterable[Pid]) -> Self:
         if isinstance(other, Pid):
-            return ProcessSet(processes=self.processes.union({other}))
+            return ProcessSet(processes=self.processes | {other})
         elif isinstance(other, ProcessSet):
-            return ProcessSet(processes=self.processes.union(other.processes))
+            return ProcessSet(processes=self.processes | other.processes)
         elif isinstance(other, Iterable):
             return ProcessSet(processes=self.processes.union(other))
         else:
@@ -194,9 +234,9 @@ class ChannelSet:
     
     def __add__(self, other: Self | Channel | Iterable[Channel]) -> Self:
         if isinstance(other, Channel):
-            return ChannelSet(channels=self.channels.union({other}))
+            return ChannelSet(channels=self.channels | {other})
         elif isinstance(other, ChannelSet):
-            return ChannelSet(channels=self.channels.union(other.channels))
+            return ChannelSet(channels=self.channels | other.channels)
         elif isinstance(other, Iterable):
             return ChannelSet(channels=self.channels.union(other))
         else:
@@ -6,7 +6,7 @@ import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Iterable, NewType
+from typing import Iterable, NewType, Optional, Protocol, Sequence, TypeVar
 
 from .pid import Pid, ProcessSet
 from .topology import NetworkTopology
@@ -15,6 +15,23 @@ from .topology import NetworkTopology
 # Type alias for simulation time
 SimTime = NewType('SimTime', timedelta)
 
+_T = TypeVar('_T')
+
+
+class RandomSource(Protocol):
+    """The random functions used by synchrony models.
+
+    Satisfied both by random.Random instances and by the random module itself.
+    """
+    def expovariate(self, lambd: float) -> float: ...
+    def uniform(self, a: float, b: float) -> float: ...
+    def choice(self, seq: Sequence[_T]) -> _T: ...
+
+
+def _random_source(rng: Optional[RandomSource]) -> RandomSource:
+    """Return the given generator, or the random module itself if there is none."""
+    return random if rng is None else rng
+
 
 def simtime(hours: float = 0, minutes: float = 0, seconds: float = 0,
             milliseconds: float = 0, microseconds: float = 0,
@@ -52,17 +69,26 @@ SIMTIME_EPSILON = simtime(microseconds=1) # Smallest distinguishable time unit
 
 @dataclass(frozen=True)
 class SynchronyModel(ABC):
+    """Base class for models of synchrony, which determine message delays.
+    
+    Attributes:
+        min_delay: The minimum delay of any message delivery. Defaults to SIMTIME_EPSILON.
+    """
     min_delay: SimTime = field(default=SIMTIME_EPSILON)
+    
     def __post_init__(self) -> None:
         if self.min_delay < SIMTIME_EPSILON:
             raise ValueError("Minimum delay must be strictly positive.")
         
     @abstractmethod
-    def arrival_time_for(self, sent_at: SimTime) -> SimTime:
+    def arrival_time_for(self, sent_at: SimTime, rng: Optional[RandomSource] = None) -> SimTime:
         """Calculate the arrival time for a message based on the synchrony model.
         
         Args:
             sent_at: The time when the message is sent.
+            rng: The random number generator used by randomized models, e.g., a seeded
+                 random.Random. Defaults to None, which uses the functions of the random
+                 module.
         
         Returns:
             The time when the message should arrive.
@@ -86,7 +112,7 @@ class Synchronous(SynchronyModel):
         if self.fixed_delay < self.min_delay:
             raise ValueError("The fixed delay must be at least as great as the minimum delay.")
     
-    def arrival_time_for(self, sent_at: SimTime) -> SimTime:
+    def arrival_time_for(self, sent_at: SimTime, rng: Optional[RandomSource] = None) -> SimTime:
         return SimTime(sent_at + self.fixed_delay)
 
 
@@ -107,8 +133,9 @@ class Asynchronous(SynchronyModel):
         if self.base_delay < self.min_delay:
             raise ValueError("Base delay must be at least as great as the minimum delay.")
     
-    def arrival_time_for(self, sent_at: SimTime) -> SimTime:
-        return SimTime(sent_at + self.min_delay + self.base_delay * (random.expovariate(lambd=2) + random.uniform(0, 1)))
+    def arrival_time_for(self, sent_at: SimTime, rng: Optional[RandomSource] = None) -> SimTime:
+        gen = _random_source(rng)
+        return SimTime(sent_at + self.min_delay + self.base_delay * (gen.expovariate(lambd=2) + gen.uniform(0, 1)))
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -129,32 +156,33 @@ class PartiallySynchronous(Synchronous):
         if self.gst <= SIMTIME_EPSILON:
             raise ValueError("Global synchronization time (GST) must be a positive time.")
     
-    def arrival_time_for(self, sent_at: SimTime) -> SimTime:
+    def arrival_time_for(self, sent_at: SimTime, rng: Optional[RandomSource] = None) -> SimTime:
         if sent_at < self.gst:
+            gen = _random_source(rng)
             # If the message is sent before the global synchronization time (GST),
-            match random.choice(["short", "long", "long", "long", "long", "near lost", "near lost", "lost", "lucky"]):
+            match gen.choice(["short", "long", "long", "long", "long", "near lost", "near lost", "lost", "lucky"]):
                 case "short":
-                    return SimTime(sent_at + SIMTIME_EPSILON + self.fixed_delay * random.uniform(0, 2))
+                    return SimTime(sent_at + SIMTIME_EPSILON + self.fixed_delay * gen.uniform(0, 2))
                 case "long":
                     return SimTime(
                         sent_at
                         + SIMTIME_EPSILON
                         + self.fixed_delay
-                            * (1 + random.uniform(0, 1) + random.expovariate(lambd=1/10))
+                            * (1 + gen.uniform(0, 1) + gen.expovariate(lambd=1/10))
                     )
                 case "near lost":
                     return SimTime(
                         self.gst
                         + SIMTIME_EPSILON
-                        + self.fixed_delay * (1_000_000 + random.expovariate(lambd=1/1_000_000))
+                        + self.fixed_delay * (1_000_000 + gen.expovariate(lambd=1/1_000_000))
                     )
                 case "lost":
                     return SimTime(max(self.gst, self.gst + simtime(days=999_999)))
                 case "lucky":
                     # occasionally, behave synchronously
-                    return super().arrival_time_for(sent_at)
+                    return super().arrival_time_for(sent_at, rng)
         else:
-            return super().arrival_time_for(sent_at)
+            return super().arrival_time_for(sent_at, rng)
 
 
 @dataclass(frozen=True)
@@ -175,8 +203,9 @@ class StochasticExponential(SynchronyModel):
         if self.delta_t < SIMTIME_EPSILON:
             raise ValueError("Delta time must be strictly positive.")
     
-    def arrival_time_for(self, sent_at: SimTime) -> SimTime:
-        return SimTime(sent_at + self.min_delay + self.delta_t * random.expovariate(lambd=1))
+    def arrival_time_for(self, sent_at: SimTime, rng: Optional[RandomSource] = None) -> SimTime:
+        gen = _random_source(rng)
+        return SimTime(sent_at + self.min_delay + self.delta_t * gen.expovariate(lambd=1))
 
 
 @dataclass(frozen=True)
@@ -202,6 +231,18 @@ class System:
         """
         return self.topology.processes()
 
+    @property
+    def n_processes(self) -> int:
+        """Return the number of processes in the system.
+        
+        Delegates to len(self.topology), so topologies that know their own
+        size can answer without building the set of processes.
+        
+        Returns:
+            The number of processes in the system.
+        """
+        return len(self.topology)
+
     def neighbors_of(self, pid: Pid) -> ProcessSet:
         """Get the neighboring processes of a given process.
         
@@ -130,7 +130,10 @@ class Ring(NetworkTopology):
         """
         if size <= 0:
             raise ValueError("Size must be a positive integer.")
-        return cls.from_((Pid(i+1) for i in range(size)), directed=directed)
+        # Process ids are generated already sorted and unique: build the ring directly
+        processes = [Pid(i+1) for i in range(size)]
+        index = {pid: i for i, pid in enumerate(processes)}
+        return cls(processes, index, directed)
 
 
 @dataclass(frozen=True)
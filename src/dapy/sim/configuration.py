@@ -27,8 +27,11 @@ class Configuration:
         Returns:
             A new Configuration with the updated states.
         """
-        new_states = {state.pid: state for state in states}
-        updated_states = {pid: new_states.get(pid, state) for pid, state in self.states.items()}
+        # Copy the mapping in one go and only replace the states of known processes
+        updated_states = self.states.copy()
+        for state in states:
+            if state.pid in updated_states:
+                updated_states[state.pid] = state
         return Configuration(updated_states)
 
     def processes(self) -> Iterable[Pid]:
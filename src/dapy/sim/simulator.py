@@ -6,7 +6,7 @@ import heapq
 from dataclasses import dataclass, field
 from typing import Optional, Self
 
-from ..core import Algorithm, Event, Message, System, SimTime, simtime
+from ..core import Algorithm, Event, Message, RandomSource, System, SimTime, simtime
 from .configuration import Configuration
 from .settings import Settings
 from .timed import TimedEvent
@@ -28,6 +28,10 @@ class Simulator:
         current_time: The current simulation time. Defaults to 0 seconds.
         settings: Configuration settings for the simulation. Defaults to default Settings.
         trace: Optional trace object for recording simulation events.
+        rng: Optional random number generator for message delays, e.g., a seeded
+             random.Random for reproducible runs. Defaults to None, which uses the
+             functions of the random module. It is not recorded in the trace. It is passed
+             to the arrival_time_for method of the synchrony model.
         scheduled_events: Priority queue of events waiting to be processed.
     """
     system: System
@@ -36,6 +40,7 @@ class Simulator:
     current_time: SimTime = field(default=simtime())
     settings: Settings = field(default_factory=Settings)
     trace: Optional[Trace] = field(default=None)
+    rng: Optional[RandomSource] = field(default=None, repr=False)
     scheduled_events: list[TimedEvent] = field(default_factory=list, init=False)
     
     
@@ -73,7 +78,8 @@ class Simulator:
                     system: System,
                     algorithm: Algorithm,
                     starting_time: SimTime = simtime(),
-                    settings: Settings = Settings()
+                    settings: Settings = Settings(),
+                    rng: Optional[RandomSource] = None
     ) -> Self:
         """Create a simulator instance from a system and algorithm.
         
@@ -83,6 +89,8 @@ class Simulator:
             starting_time: The initial simulation time. Defaults to 0 seconds.
             settings: Configuration settings for the simulation.
                      Defaults to default Settings.
+            rng: Optional random number generator for message delays.
+                 Defaults to None, which uses the functions of the random module.
         
         Returns:
             A new Simulator instance initialized with the given system and algorithm.
@@ -93,7 +101,8 @@ class Simulator:
             algorithm=algorithm,
             current_configuration=current_configuration,
             current_time=starting_time,
-            settings=settings
+            settings=settings,
+            rng=rng
         )       
     
     def start(self) -> None:
@@ -121,7 +130,7 @@ class Simulator:
             system's synchrony model.
         """
         if isinstance(event, Message):
-            return self.system.synchrony.arrival_time_for(self.current_time)
+            return self.system.synchrony.arrival_time_for(self.current_time, self.rng)
         else:
             return self.current_time
         
@@ -218,9 +227,9 @@ class Simulator:
         path = Path(filename)
         
         if format == 'pickle':
-            # Binary mode for pickle
+            # Binary mode for pickle, streamed to the file rather than built in memory
             with open(path, 'wb') as f:
-                f.write(self.trace.dump_pickle())
+                self.trace.write_pickle(f)
         elif format == 'json':
             # Text mode for JSON
             with open(path, 'w', encoding='utf-8') as f:
@@ -1,9 +1,12 @@
 # Copyright (c) 2025-2026 Xavier Defago
 # SPDX-License-Identifier: MIT
 
+import pickle
+import re
+
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Iterable, Self
+from typing import BinaryIO, Iterable, Self
 
 from dapy.core.system import simtime
 
@@ -69,8 +72,9 @@ class Trace:
     
     A trace records both the events (messages and signals) exchanged between
     processes and the system configurations at various time points during
-    the simulation. Trace files are self-documenting with algorithm metadata,
-    allowing viewing without access to the original algorithm implementation.
+    the simulation. Trace files are self-documenting with algorithm metadata.
+    Loading a trace file still requires the modules defining the algorithm's
+    message, signal, and state classes to be importable.
     
     Attributes:
         system: The distributed system being simulated.
@@ -116,8 +120,9 @@ class Trace:
     def dump(self) -> bytes:
         """Serialize the trace to pickle format (default).
         
-        This is the recommended serialization method. Pickle format is compact,
-        fast, and doesn't require access to algorithm implementation classes.
+        This is the recommended serialization method. Pickle format is compact
+        and fast; loading it requires the algorithm's message, signal, and state
+        classes to be importable (see dump_pickle).
         
         Returns:
             The serialized trace as bytes.
@@ -136,18 +141,33 @@ class Trace:
         """
         return cls.load_pickle(data)
 
-    def dump_pickle(self) -> bytes:
+    def dump_pickle(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
         """Serialize the trace to a pickle byte string.
         
-        Uses pickle protocol 4 which allows deserialization without access to
-        the original algorithm, message, signal, or state classes. The trace
-        remains fully self-contained and can be loaded and visualized anywhere.
+        Uses the highest pickle protocol by default, which yields the smallest
+        output and the fastest serialization and deserialization. Loading the
+        trace requires the modules defining the algorithm, message, signal,
+        and state classes to be importable.
+        
+        Args:
+            protocol: The pickle protocol to use. Defaults to pickle.HIGHEST_PROTOCOL.
         
         Returns:
             The serialized trace as bytes.
         """
-        import pickle
-        return pickle.dumps(self, protocol=4)
+        return pickle.dumps(self, protocol=protocol)
+    
+    def write_pickle(self, file: BinaryIO, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        """Serialize the trace in pickle format directly to a binary file.
+        
+        Produces the same bytes as dump_pickle, but streams them to the file
+        instead of building the whole pickle in memory first.
+        
+        Args:
+            file: A binary file object open for writing.
+            protocol: The pickle protocol to use. Defaults to pickle.HIGHEST_PROTOCOL.
+        """
+        pickle.dump(self, file, protocol=protocol)
     
     @classmethod
     def load_pickle(cls, data: bytes) -> Self:
@@ -162,7 +182,6 @@ class Trace:
         Raises:
             TypeError: If the deserialized object is not a Trace instance.
         """
-        import pickle
         obj = pickle.loads(data)
         if not isinstance(obj, cls):
             raise TypeError(f"Expected Trace, got {type(obj)}")
@@ -203,11 +222,12 @@ class Trace:
         return json.dumps(obj, indent=2)
 
     @classmethod
-    def load_json(cls, data: str) -> Self:
+    def load_json(cls, data: str | bytes) -> Self:
         """Deserialize a trace from a JSON string.
         
         Args:
-            data: The serialized trace as a JSON string.
+            data: The serialized trace as a JSON string, or as UTF-8 encoded bytes
+                (e.g., read directly from a file without decoding it first).
         
         Returns:
             A Trace instance deserialized from the JSON string.
@@ -233,28 +253,30 @@ class Trace:
 
 
 
+# Matches the repr of a timedelta, as written by `Trace.dump_json`
+_TIMEDELTA_REPR = re.compile(r"^datetime\.timedelta\((?P<args>.*)\)$")
+
+
 def _parse_timedelta(timedelta_str: str) -> SimTime:
     """
     Parse a string to create a timedelta object.
+    
+    This is called once per timestamp when loading a JSON trace, so the
+    arguments are parsed as integers directly rather than evaluated.
     """
-    import re
-    match = re.match(r"^datetime.timedelta\((?P<args>.*)\)$", timedelta_str)
+    match = _TIMEDELTA_REPR.match(timedelta_str)
     if not match:
         raise ValueError(f"Invalid timedelta string: {timedelta_str}")
     
-    args = match.group("args").split(",")
-    kwargs = {}
-    if args == ["0"]:
-        return simtime(0)
+    args = match.group("args")
+    if args == "0":
+        return simtime()
     
-    for arg in args:
-        if "=" in arg:
-            key, value = arg.split("=")
-            kwargs[key.strip()] = eval(value.strip())
-        else:
-            kwargs[arg.strip()] = None
+    kwargs = {}
+    for arg in args.split(","):
+        key, sep, value = arg.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid timedelta string: {timedelta_str}")
+        kwargs[key.strip()] = int(value)
     
-    return simtime(**kwargs)
-
-
-
+    return SimTime(timedelta(**kwargs))
@@ -9,7 +9,22 @@ try:
 except Exception:
     __version__ = "0.0.0"  # Fallback if not installed
 
+from typing import TYPE_CHECKING
+
 __all__ = ["TraceViewerApp", "TraceWindow"]
 
-from dapyview.app import TraceViewerApp
-from dapyview.trace_window import TraceWindow
+if TYPE_CHECKING:
+    from dapyview.app import TraceViewerApp
+    from dapyview.trace_window import TraceWindow
+
+
+def __getattr__(name: str) -> object:
+    # The windows are imported on first access, so that importing a submodule
+    # (e.g., the command-line entry point) does not load Qt up front
+    if name == "TraceViewerApp":
+        from dapyview.app import TraceViewerApp
+        return TraceViewerApp
+    if name == "TraceWindow":
+        from dapyview.trace_window import TraceWindow
+        return TraceWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
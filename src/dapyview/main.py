@@ -9,11 +9,6 @@ import sys
 from pathlib import Path
 from typing import List
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox
-
-from dapyview.trace_window import TraceWindow
-
 
 def open_file_selector() -> List[Path]:
     """Show file dialog to select trace files.
@@ -21,6 +16,8 @@ def open_file_selector() -> List[Path]:
     Returns:
         List of selected trace file paths (empty if cancelled).
     """
+    from PySide6.QtWidgets import QFileDialog
+    
     file_dialog = QFileDialog()
     file_paths, _ = file_dialog.getOpenFileNames(
         None,
@@ -37,13 +34,6 @@ def main() -> int:
     Returns:
         Exit code (0 for success, non-zero for error).
     """
-    # Enable high DPI scaling for Retina displays
-    # Note: AA_EnableHighDpiScaling and AA_UseHighDpiPixmaps are deprecated in Qt6
-    # High DPI scaling is now enabled by default
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-    
     parser = argparse.ArgumentParser(
         prog='dapyview',
         description='dapyview - GUI Trace Viewer for dapy distributed algorithms',
@@ -68,6 +58,20 @@ def main() -> int:
     
     args = parser.parse_args()
     
+    # Qt and the viewer are only imported once the arguments are parsed,
+    # so that --help and --version do not pay for loading them
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication, QMessageBox
+    
+    from dapyview.trace_window import TraceWindow
+    
+    # Enable high DPI scaling for Retina displays
+    # Note: AA_EnableHighDpiScaling and AA_UseHighDpiPixmaps are deprecated in Qt6
+    # High DPI scaling is now enabled by default
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Dapy Trace Viewer")
     app.setOrganizationName("Dapy")
@@ -5,7 +5,7 @@
 
 import math
 
-from typing import List, Optional, Set
+from typing import AbstractSet, List, Optional, Set
 
 from PySide6.QtCore import QPointF, QSize, Qt, Signal
 from PySide6.QtGui import (
@@ -180,6 +180,8 @@ class TimeSpaceDiagram(QWidget):
         Args:
             use_logical: True for Lamport clocks, False for timestamps.
         """
+        if use_logical == self.use_logical_time:
+            return
         self.use_logical_time = use_logical
         self._update_size()
         self.update()
@@ -190,6 +192,8 @@ class TimeSpaceDiagram(QWidget):
         Args:
             factor: Zoom factor (1.0 = 100%).
         """
+        if factor == self.zoom_factor:
+            return
         self.zoom_factor = factor
         self._update_size()
         self.update()
@@ -204,6 +208,24 @@ class TimeSpaceDiagram(QWidget):
         self.selected_process = pid
         self.update()
     
+    def highlights_only_messages(self, messages: AbstractSet[int]) -> bool:
+        """Check whether exactly the given messages are highlighted, and nothing else.
+        
+        Args:
+            messages: Indices of the messages expected to be highlighted.
+        
+        Returns:
+            True if highlighting these messages would leave the diagram unchanged.
+        """
+        return (
+            self.highlighted_messages == messages
+            and not self.highlighted_processes
+            and not self.highlighted_events
+            and self.selected_event is None
+            and self.selected_message is None
+            and self.selected_process is None
+        )
+    
     def clear_highlights(self) -> None:
         """Clear all highlights."""
         self.highlighted_processes.clear()
@@ -783,10 +805,10 @@ class TraceCanvas(QScrollArea):
         viewport_palette.setColor(self.viewport().backgroundRole(), QColor(50, 50, 50))
         self.viewport().setPalette(viewport_palette)
         
-        # Forward signals
-        self.diagram.process_selected.connect(self.process_selected.emit)
-        self.diagram.event_selected.connect(self.event_selected.emit)
-        self.diagram.message_selected.connect(self.message_selected.emit)
+        # Forward signals (signal-to-signal connections, without a Python slot in between)
+        self.diagram.process_selected.connect(self.process_selected)
+        self.diagram.event_selected.connect(self.event_selected)
+        self.diagram.message_selected.connect(self.message_selected)
     
     def set_time_mode(self, use_logical: bool) -> None:
         """Set time mode."""
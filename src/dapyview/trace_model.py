@@ -7,13 +7,14 @@ from dataclasses import dataclass, field
 from typing import Optional, Self
 
 import networkx as nx
+import numpy as np
 
 from dapy.core import Pid
 from dapy.core.event import Event, Message
 from dapy.sim import Trace
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LamportClock:
     """Lamport logical clock for tracking event ordering."""
     _value: int = 0
@@ -150,7 +151,7 @@ class VectorClock:
     _clock: dict[Pid, int] = field(default_factory=dict)
     
     @classmethod
-    def create(cls, processes: set[Pid], initial_values: Optional[dict[Pid, int]] = None) -> Self:
+    def create(cls, processes: set[Pid] | frozenset[Pid], initial_values: Optional[dict[Pid, int]] = None) -> Self:
         """Create a new vector clock.
         
         Args:
@@ -518,6 +519,14 @@ class TraceModel:
                 )
                 self.events.append(event_node)
                 event_node_index += 1
+        
+        # Message endpoints as contiguous arrays (structure of arrays) for bulk filtering
+        self._message_senders = np.fromiter(
+            (msg.sender.id for msg in self.messages), dtype=np.int64, count=len(self.messages)
+        )
+        self._message_receivers = np.fromiter(
+            (msg.receiver.id for msg in self.messages), dtype=np.int64, count=len(self.messages)
+        )
     
     def _get_clock_at_time(self, timeline: list[tuple[float, int]], time: float) -> int:
         """Get the clock value at a specific time from a timeline.
@@ -557,6 +566,21 @@ class TraceModel:
         process_events = [e for e in self.events if e.pid == pid]
         return sorted(process_events, key=lambda e: e.time)
     
+    def get_messages_between(self, pid1: Pid, pid2: Pid) -> list[int]:
+        """Get all messages exchanged between two processes, in either direction.
+        
+        Args:
+            pid1: First process identifier.
+            pid2: Second process identifier.
+            
+        Returns:
+            Indices into `messages`, in increasing order.
+        """
+        a, b = pid1.id, pid2.id
+        senders, receivers = self._message_senders, self._message_receivers
+        mask = ((senders == a) & (receivers == b)) | ((senders == b) & (receivers == a))
+        return np.flatnonzero(mask).tolist()
+    
     def get_time_range(self) -> tuple[float, float]:
         """Get the physical time range of the trace.
         
@@ -4,21 +4,14 @@
 """Trace window displaying time-space diagram visualization."""
 
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QAction, QCloseEvent, QResizeEvent
 from PySide6.QtWidgets import QFileDialog, QMainWindow, QMessageBox, QVBoxLayout, QWidget
 
+from dapy.core import Pid
 from dapy.sim import Trace
-
-# Import common algorithm modules so classifiedjson can deserialize them
-# Users may need to import their custom algorithm modules before loading traces
-try:
-    import dapy.algo.learn  # For LearnGraphAlgorithm traces  # noqa: F401
-except ImportError:
-    pass  # Module might not be available
-
 from dapyview.minimap import Corner, MinimapWidget
 from dapyview.toolbar import TraceToolbar
 from dapyview.trace_canvas import TraceCanvas
@@ -29,7 +22,7 @@ class TraceWindow(QMainWindow):
     """Native window displaying a single trace visualization."""
     
     # Class variable to track all open windows
-    _open_windows: ClassVar[list['TraceWindow']] = []
+    _open_windows: ClassVar[set['TraceWindow']] = set()
     
     def __init__(self, trace_file: Path) -> None:
         """Initialize trace window.
@@ -60,7 +53,7 @@ class TraceWindow(QMainWindow):
         self.resize(1000, 700)
         
         # Track this window
-        TraceWindow._open_windows.append(self)
+        TraceWindow._open_windows.add(self)
     
     def _load_trace_file(self, trace_file: Path) -> Trace:
         """Load a trace from either pickle or JSON format.
@@ -78,30 +71,29 @@ class TraceWindow(QMainWindow):
         if not trace_file.exists():
             raise FileNotFoundError(f"Trace file not found: {trace_file}")
         
+        # Read the file once; parsing is done from the in-memory buffer
+        data = trace_file.read_bytes()
+        
         # Determine format by extension
         suffix = trace_file.suffix.lower()
         
         if suffix in ['.pkl', '.pickle']:
             # Load pickle format (default)
-            with open(trace_file, 'rb') as f:
-                return Trace.load_pickle(f.read())
+            return Trace.load_pickle(data)
         elif suffix == '.json':
             # Load JSON format
-            with open(trace_file, 'r', encoding='utf-8') as f:
-                return Trace.load_json(f.read())
+            return Trace.load_json(data)
         else:
-            # Try to auto-detect format
-            # First, try as pickle (most common)
+            # Auto-detect format: pickle streams (protocol 2 and above) start with
+            # the PROTO opcode, which cannot start a JSON document
             try:
-                with open(trace_file, 'rb') as f:
-                    return Trace.load_pickle(f.read())
-            except Exception:
-                pass
-            
-            # If pickle fails, try as JSON
-            try:
-                with open(trace_file, 'r', encoding='utf-8') as f:
-                    return Trace.load_json(f.read())
+                if data[:1] == b'\x80':
+                    return Trace.load_pickle(data)
+                try:
+                    return Trace.load_json(data)
+                except Exception:
+                    # Protocol 0 and 1 pickles have no PROTO opcode
+                    return Trace.load_pickle(data)
             except Exception as e:
                 raise ValueError(
                     f"Could not load trace file as pickle or JSON: {trace_file}\n"
@@ -196,9 +188,12 @@ class TraceWindow(QMainWindow):
         self.canvas = TraceCanvas(self.model)
         layout.addWidget(self.canvas, stretch=1)
         
-        # Create minimap as overlay (child of viewport for proper positioning)
-        self.minimap = MinimapWidget(self.model, self.canvas.viewport())
-        self.minimap.raise_()  # Ensure it's on top
+        # Minimap overlay is created lazily, once the viewport has a size (see _ensure_minimap)
+        self.minimap: Optional[MinimapWidget] = None
+        
+        # Last edge selected in the minimap and its messages, to skip redundant repaints
+        self._last_highlighted_edge: Optional[frozenset[Pid]] = None
+        self._last_edge_messages: frozenset[int] = frozenset()
         
         # Position minimap after layout is complete (use timer to ensure viewport has size)
         QTimer.singleShot(0, self._position_minimap)
@@ -207,16 +202,37 @@ class TraceWindow(QMainWindow):
         self.toolbar.time_mode_changed.connect(self.canvas.set_time_mode)
         self.toolbar.zoom_changed.connect(self.canvas.set_zoom)
         self.toolbar.ruler_requested.connect(self._add_ruler)
+    
+    def _ensure_minimap(self) -> MinimapWidget:
+        """Create the minimap overlay on first use.
+        
+        Building the minimap computes a layout of the topology, so it is deferred
+        until the window is laid out instead of slowing down window creation.
+        
+        Returns:
+            The minimap widget.
+        """
+        if self.minimap is not None:
+            return self.minimap
+        
+        # Create minimap as overlay (child of viewport for proper positioning)
+        minimap = MinimapWidget(self.model, self.canvas.viewport())
+        minimap.raise_()  # Ensure it's on top
         
         # Canvas <-> Minimap process highlighting
-        self.canvas.process_selected.connect(self.minimap.highlight_process)
-        self.minimap.process_selected.connect(self.canvas.highlight_process)
+        self.canvas.process_selected.connect(minimap.highlight_process)
+        minimap.process_selected.connect(self.canvas.highlight_process)
         
         # Edge selection in minimap highlights related messages
-        self.minimap.edge_selected.connect(self._on_edge_selected)
+        minimap.edge_selected.connect(self._on_edge_selected)
         
         # Minimap corner dragging
-        self.minimap.corner_changed.connect(self._on_minimap_corner_changed)
+        minimap.corner_changed.connect(self._on_minimap_corner_changed)
+        
+        # Widgets added after their parent is shown are hidden by default
+        minimap.show()
+        self.minimap = minimap
+        return minimap
     
     def _position_minimap(self) -> None:
         """Position the minimap based on current corner setting."""
@@ -233,9 +249,10 @@ class TraceWindow(QMainWindow):
             QTimer.singleShot(50, self._position_minimap)
             return
         
-        corner = self.minimap.current_corner
-        mm_width = self.minimap.width()
-        mm_height = self.minimap.height()
+        minimap = self._ensure_minimap()
+        corner = minimap.current_corner
+        mm_width = minimap.width()
+        mm_height = minimap.height()
         
         if corner == Corner.TOP_LEFT:
             x = margin
@@ -250,7 +267,7 @@ class TraceWindow(QMainWindow):
             x = vp_width - mm_width - margin
             y = vp_height - mm_height - margin
         
-        self.minimap.move(x, y)
+        minimap.move(x, y)
     
     def _on_minimap_corner_changed(self, corner: Corner) -> None:
         """Handle minimap being dragged to a new corner."""
@@ -260,15 +277,23 @@ class TraceWindow(QMainWindow):
         """Add a ruler to the canvas."""
         self.canvas.add_ruler()
     
-    def _on_edge_selected(self, sender: int, receiver: int) -> None:
+    def _on_edge_selected(self, sender: Pid, receiver: Pid) -> None:
         """Handle edge selection in minimap by highlighting related messages."""
+        diagram = self.canvas.diagram
+        edge = frozenset((sender, receiver))
+        # Selecting the same edge again is a no-op, unless the canvas highlights changed in between
+        if edge == self._last_highlighted_edge and diagram.highlights_only_messages(self._last_edge_messages):
+            return
+        messages = frozenset(self.model.get_messages_between(sender, receiver))
+        self._last_highlighted_edge = edge
+        self._last_edge_messages = messages
+        if diagram.highlights_only_messages(messages):
+            return
+        
         # Highlight all messages between these two processes
-        self.canvas.diagram.clear_highlights()
-        for idx, msg in enumerate(self.model.messages):
-            if (msg.sender == sender and msg.receiver == receiver) or \
-               (msg.sender == receiver and msg.receiver == sender):
-                self.canvas.diagram.highlighted_messages.add(idx)
-        self.canvas.diagram.update()
+        diagram.clear_highlights()
+        diagram.highlighted_messages.update(messages)
+        diagram.update()
     
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle resize to reposition minimap overlay."""
@@ -277,6 +302,5 @@ class TraceWindow(QMainWindow):
     
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle window close to track open windows."""
-        if self in TraceWindow._open_windows:
-            TraceWindow._open_windows.remove(self)
+        TraceWindow._open_windows.discard(self)
         super().closeEvent(event)
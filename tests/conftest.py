@@ -8,23 +8,39 @@ from typing import Optional
 import pytest
 
 from dapy.algo.learn import LearnGraphAlgorithm, Start
-from dapy.core import Pid, Ring, Synchronous, System
+from dapy.core import Asynchronous, Pid, Ring, Synchronous, System
 from dapy.core.system import simtime
 from dapy.sim import Settings, Simulator, Trace
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_ring_system() -> System:
-    """Create a simple Ring system with 3 processes for testing."""
+    """Create a simple Ring system with 3 processes for testing.
+    
+    The system is immutable, so a single instance is shared by the whole session.
+    """
     return System(
         topology=Ring.of_size(3),
         synchrony=Synchronous(fixed_delay=simtime(seconds=1)),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def ring3_async_system() -> System:
+    """Create an asynchronous Ring system with 3 processes, shared by the whole session."""
+    return System(
+        topology=Ring.of_size(3),
+        synchrony=Asynchronous(),
+    )
+
+
+@pytest.fixture(scope="session")
 def trace_from_learn_algorithm(simple_ring_system: System) -> Optional[Trace]:
-    """Generate a trace from the LearnGraphAlgorithm on a ring."""
+    """Generate a trace from the LearnGraphAlgorithm on a ring.
+    
+    The simulation is deterministic, so it is run once per session. Tests must
+    not modify the returned trace; copy it first if needed.
+    """
     settings = Settings(enable_trace=True)
     system = simple_ring_system
     algorithm = LearnGraphAlgorithm(system)
@@ -36,3 +52,17 @@ def trace_from_learn_algorithm(simple_ring_system: System) -> Optional[Trace]:
     sim.run_to_completion()
 
     return sim.trace
+
+
+@pytest.fixture(scope="session")
+def trace_json_blob(trace_from_learn_algorithm: Optional[Trace]) -> str:
+    """Serialize the learn algorithm trace to JSON, once per session."""
+    assert trace_from_learn_algorithm is not None
+    return trace_from_learn_algorithm.dump_json()
+
+
+@pytest.fixture(scope="session")
+def trace_pickle_blob(trace_from_learn_algorithm: Optional[Trace]) -> bytes:
+    """Serialize the learn algorithm trace to pickle, once per session."""
+    assert trace_from_learn_algorithm is not None
+    return trace_from_learn_algorithm.dump_pickle()
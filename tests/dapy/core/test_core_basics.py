@@ -5,10 +5,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-
+import inspect
+import pickle
 import random
 
+from dataclasses import dataclass
+from typing import Sequence, TypeVar
+
 import pytest
 
 from dapy.core import (
@@ -21,7 +24,6 @@ from dapy.core import (
     PartiallySynchronous,
     Pid,
     ProcessSet,
-    Ring,
     Signal,
     State,
     StochasticExponential,
@@ -30,6 +32,8 @@ from dapy.core import (
     simtime,
 )
 
+T = TypeVar("T")
+
 
 def test_pid_basics() -> None:
     pid = Pid(3)
@@ -40,6 +44,23 @@ def test_pid_basics() -> None:
         Pid(-1)
 
 
+def test_pid_interning() -> None:
+    assert Pid(3) is Pid(3)
+    assert Pid(Pid(3)) is Pid(3)
+    assert pickle.loads(pickle.dumps(Pid(3))) is Pid(3)
+    assert Pid(10**6) == Pid(10**6)
+    with pytest.raises(TypeError):
+        Pid()  # type: ignore[call-arg]
+    assert inspect.signature(Pid).parameters["id"].default is inspect.Parameter.empty
+    with pytest.raises(TypeError):
+        Pid(None)  # type: ignore[arg-type]
+    # Hash-equal values of other types do not taint the interned instances
+    assert Pid(True) is not Pid(1)
+    assert repr(Pid(1)) == "Pid(1)"
+    assert Pid(3.0) is not Pid(3)  # type: ignore[arg-type]
+    assert str(Pid(3)) == "p3"
+
+
 def test_process_set_operations() -> None:
     p1, p2 = Pid(1), Pid(2)
     ps = ProcessSet(p1)
@@ -153,8 +174,8 @@ class NamedAlgorithm(MyAlgorithm):
     algorithm_description: str | None = "Custom description."
 
 
-def test_algorithm_name_and_description() -> None:
-    system = System(topology=Ring.of_size(3))
+def test_algorithm_name_and_description(ring3_async_system: System) -> None:
+    system = ring3_async_system
     algo = MyAlgorithm(system)
     assert algo.name == "MyAlgorithm"
     assert algo.description == "Short description line."
@@ -167,27 +188,51 @@ def test_algorithm_name_and_description() -> None:
     assert algo.on_start(state) == (state, [])
 
 
-def test_synchrony_models_deterministic(monkeypatch: pytest.MonkeyPatch) -> None:
+class FixedRandom:
+    """Random number generator stub returning fixed values."""
+
+    def __init__(self, value: float = 0.0, choice: object = None) -> None:
+        self.value = value
+        self.chosen = choice
+
+    def expovariate(self, lambd: float) -> float:
+        return self.value
+
+    def uniform(self, a: float, b: float) -> float:
+        return self.value
+
+    def choice(self, seq: Sequence[T]) -> T:
+        return next(item for item in seq if item == self.chosen)
+
+
+def test_synchrony_models_deterministic() -> None:
     sent_at = simtime(seconds=1)
 
     sync = Synchronous(fixed_delay=simtime(milliseconds=2))
     assert sync.arrival_time_for(sent_at) == sent_at + simtime(milliseconds=2)
 
     async_model = Asynchronous(base_delay=simtime(seconds=2))
-    monkeypatch.setattr(random, "expovariate", lambda _lambd=None, **_kwargs: 0.0)
-    monkeypatch.setattr(random, "uniform", lambda _a, _b: 0.0)
-    assert async_model.arrival_time_for(sent_at) == sent_at + async_model.min_delay
+    assert async_model.arrival_time_for(sent_at, FixedRandom(0.0)) == sent_at + async_model.min_delay
 
     stochastic = StochasticExponential(delta_t=simtime(milliseconds=10))
-    monkeypatch.setattr(random, "expovariate", lambda _lambd=None, **_kwargs: 1.5)
-    assert stochastic.arrival_time_for(sent_at) == sent_at + stochastic.min_delay + simtime(milliseconds=15)
+    assert stochastic.arrival_time_for(sent_at, FixedRandom(1.5)) == (
+        sent_at + stochastic.min_delay + simtime(milliseconds=15)
+    )
+
+
+def test_synchrony_model_seeded_rng() -> None:
+    sent_at = simtime(seconds=1)
+    model = Asynchronous()
+    rng, same_rng = random.Random(42), random.Random(42)
+    assert [model.arrival_time_for(sent_at, rng) for _ in range(5)] == [
+        model.arrival_time_for(sent_at, same_rng) for _ in range(5)
+    ]
 
 
-def test_partially_synchronous_lucky_path(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_partially_synchronous_lucky_path() -> None:
     sent_at = simtime(seconds=1)
     model = PartiallySynchronous(gst=simtime(seconds=10), fixed_delay=simtime(milliseconds=3))
-    monkeypatch.setattr(random, "choice", lambda _choices: "lucky")
-    assert model.arrival_time_for(sent_at) == sent_at + simtime(milliseconds=3)
+    assert model.arrival_time_for(sent_at, FixedRandom(choice="lucky")) == sent_at + simtime(milliseconds=3)
 
 
 def test_synchrony_model_validation() -> None:
@@ -199,8 +244,9 @@ def test_synchrony_model_validation() -> None:
         _ = StochasticExponential(delta_t=simtime(seconds=0))
 
 
-def test_system_processes_and_neighbors() -> None:
-    system = System(topology=Ring.of_size(3), synchrony=Asynchronous())
+def test_system_processes_and_neighbors(ring3_async_system: System) -> None:
+    system = ring3_async_system
     processes = list(system.processes())
     assert len(processes) == 3
+    assert system.n_processes == 3
     assert system.neighbors_of(Pid(1)) == ProcessSet({Pid(2), Pid(3)})
\ No newline at end of file
@@ -3,7 +3,9 @@
 
 """Test suite for network topology implementations."""
 
-from typing import Optional
+import functools
+
+from typing import Optional, TypeVar
 
 import pytest
 
@@ -11,12 +13,26 @@ from dapy.core.topology import Arbitrary, Channel, CompleteGraph, NetworkTopolog
 
 # Helper functions for topology validation
 
+T = TypeVar("T", Ring, CompleteGraph, Star)
+
+
+@functools.lru_cache(maxsize=None)
+def _of_size(kind: type[T], size: int) -> T:
+    """Build a topology with sequential process IDs, once per kind and size."""
+    return kind.of_size(size)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_processes(size: int) -> ProcessSet:
+    """Build the processes of a topology with sequential process IDs, once per size."""
+    return ProcessSet(Pid(i + 1) for i in range(size))
+
 
 def assert_all_processes_present(topology: NetworkTopology, processes: ProcessSet) -> None:
     """Assert that all processes are present in the topology."""
-    for pid in processes.processes:
-        assert pid in topology.processes()
-        assert pid in topology
+    procs = processes.processes
+    assert procs <= topology.processes().processes
+    assert all(pid in topology for pid in procs)
 
 
 def assert_no_self_neighbors(topology: NetworkTopology) -> None:
@@ -28,20 +44,29 @@ def assert_no_self_neighbors(topology: NetworkTopology) -> None:
 def assert_valid_topology(topology: NetworkTopology, size: int, processes: Optional[ProcessSet] = None) -> None:
     """Assert that a topology is valid (basic properties)."""
     if processes is None:
-        processes = ProcessSet(Pid(i + 1) for i in range(size))
+        processes = _default_processes(size)
     
-    assert topology.processes() == processes
+    topology_processes = topology.processes()
+    assert topology_processes == processes
     assert len(topology) == size
-    assert len(topology.processes()) == size
+    assert len(topology_processes) == size
     
-    # Get min and max from processes attribute
-    pids = list(processes.processes)
-    min_pid = min(pids)
-    max_pid = max(pids)
-    assert Pid(min_pid.id - 1) not in topology
+    # Get min and max from processes attribute, in a single pass
+    pids = iter(processes.processes)
+    min_pid = max_pid = next(pids)
+    for pid in pids:
+        if pid < min_pid:
+            min_pid = pid
+        elif pid > max_pid:
+            max_pid = pid
+    
+    # Pids just outside the range of the processes must not be in the topology
+    below = Pid(min_pid.id - 1)
+    above = Pid(max_pid.id + 1)
+    assert below not in topology
     assert min_pid in topology
     assert max_pid in topology
-    assert Pid(max_pid.id + 1) not in topology
+    assert above not in topology
     
     assert_all_processes_present(topology, processes)
     assert_no_self_neighbors(topology)
@@ -50,42 +75,49 @@ def assert_valid_topology(topology: NetworkTopology, size: int, processes: Optio
 def assert_valid_ring(topology: NetworkTopology, size: int, processes: Optional[ProcessSet] = None) -> None:
     """Assert that a Ring topology has correct neighbor relationships."""
     if processes is None:
-        processes = ProcessSet(Pid(i + 1) for i in range(size))
+        processes = _default_processes(size)
     
     indexed_processes = list(processes.processes)
     
     # Check the neighbors of each process
-    for i, pid in enumerate(processes.processes):
+    for i, pid in enumerate(indexed_processes):
         prev = indexed_processes[i - 1]
         next_pid = indexed_processes[(i + 1) % size]
-        assert len(topology.neighbors_of(pid)) == 2
         assert topology.neighbors_of(pid) == ProcessSet({prev, next_pid})
 
 
 def assert_valid_complete_graph(topology: CompleteGraph, size: int, processes: Optional[ProcessSet] = None) -> None:
     """Assert that a CompleteGraph topology has all pairwise connections."""
     if processes is None:
-        processes = ProcessSet(Pid(i + 1) for i in range(size))
+        processes = _default_processes(size)
     
-    # Check the neighbors of each process
+    # Check the neighbors of each process: size - 1 processes of the topology, other than
+    # the process itself, are necessarily all the others (no need to build the full set)
+    all_processes = topology.processes().processes
     for pid in processes.processes:
-        assert len(topology.neighbors_of(pid)) == size - 1
-        assert topology.neighbors_of(pid) + {pid} == topology.processes()
+        neighbors = topology.neighbors_of(pid).processes
+        assert len(neighbors) == size - 1
+        assert pid not in neighbors
+        assert neighbors <= all_processes
 
 
 def assert_valid_star(topology: Star, size: int, processes: Optional[ProcessSet] = None) -> None:
     """Assert that a Star topology has correct hub-and-spoke structure."""
     if processes is None:
-        processes = ProcessSet(Pid(i + 1) for i in range(size))
+        processes = _default_processes(size)
+    
+    center = topology.center()
+    all_processes = topology.processes()
+    leaf_neighbors = ProcessSet(center)
     
     # Check the neighbors of each process
     for pid in processes.processes:
-        if pid == topology.center():
-            assert len(topology.neighbors_of(pid)) == size - 1
-            assert topology.neighbors_of(pid) + {pid} == topology.processes()
+        neighbors = topology.neighbors_of(pid)
+        if pid == center:
+            assert pid not in neighbors
+            assert neighbors + {pid} == all_processes
         else:
-            assert len(topology.neighbors_of(pid)) == 1
-            assert topology.neighbors_of(pid) == ProcessSet(topology.center())
+            assert neighbors == leaf_neighbors
 
 
 # Test classes
@@ -97,7 +129,7 @@ class TestRingTopology:
     @pytest.mark.parametrize("size", [4])
     def test_ring_of_size(self, size: int) -> None:
         """Test Ring topology with sequential process IDs."""
-        topology = Ring.of_size(size)
+        topology = _of_size(Ring, size)
         assert_valid_topology(topology, size)
         assert_valid_ring(topology, size)
 
@@ -112,10 +144,13 @@ class TestRingTopology:
 class TestCompleteGraphTopology:
     """Test suite for CompleteGraph topology."""
 
-    @pytest.mark.parametrize("size", [2, 4, 9])
+    @pytest.mark.parametrize(
+        "size",
+        [2, 4, *(pytest.param(size, marks=pytest.mark.slow) for size in (9, 32, 128))],
+    )
     def test_complete_graph_of_size(self, size: int) -> None:
         """Test CompleteGraph topology with sequential process IDs."""
-        topology = CompleteGraph.of_size(size)
+        topology = _of_size(CompleteGraph, size)
         assert_valid_topology(topology, size)
         assert_valid_complete_graph(topology, size)
 
@@ -139,7 +174,7 @@ class TestStarTopology:
     @pytest.mark.parametrize("size", [2, 4, 9])
     def test_star_of_size(self, size: int) -> None:
         """Test Star topology with sequential process IDs."""
-        topology = Star.of_size(size)
+        topology = _of_size(Star, size)
         assert_valid_topology(topology, size)
         assert_valid_star(topology, size)
 
@@ -172,58 +207,43 @@ class TestArbitraryTopology:
         processes = ProcessSet({Pid(1), Pid(2), Pid(3)})
         topology = Arbitrary.from_(list(processes.processes))
         assert_valid_topology(topology, 3, processes)
-        for pid in processes.processes:
-            assert topology.neighbors_of(pid) == ProcessSet()
-
-    def test_arbitrary_directed_ring_from_tuples(self) -> None:
-        """Test Arbitrary topology with directed ring from tuples."""
+        no_neighbors = ProcessSet()
+        assert all(topology.neighbors_of(pid) == no_neighbors for pid in processes.processes)
+
+    @pytest.mark.parametrize(
+        ("channels", "directed"),
+        [
+            pytest.param(
+                [(Pid(1), Pid(2)), (Pid(2), Pid(3)), (Pid(3), Pid(1))],
+                True,
+                id="directed-tuples",
+            ),
+            pytest.param(
+                [(Pid(1), Pid(2)), (Pid(2), Pid(3)), (Pid(3), Pid(1))],
+                False,
+                id="undirected-tuples",
+            ),
+            pytest.param(
+                [Channel(Pid(1), Pid(2)), Channel(Pid(2), Pid(3)), Channel(Pid(3), Pid(1))],
+                False,
+                id="undirected-channels",
+            ),
+            pytest.param(
+                [Pid(1), Pid(2), Channel(Pid(1), Pid(2)), (Pid(2), Pid(3)), Channel(Pid(3), Pid(1))],
+                False,
+                id="undirected-mixed",
+            ),
+        ],
+    )
+    def test_arbitrary_ring(self, channels: list, directed: bool) -> None:
+        """Test Arbitrary topology forming a ring, from tuples, Channel objects, or mixed objects."""
         processes = ProcessSet({Pid(1), Pid(2), Pid(3)})
-        channels = [
-            (Pid(1), Pid(2)),
-            (Pid(2), Pid(3)),
-            (Pid(3), Pid(1)),
-        ]
-        topology = Arbitrary.from_(channels)
+        topology: NetworkTopology = Arbitrary.from_(channels, directed=directed)
         assert_valid_topology(topology, 3, processes)
-        for pid in processes.processes:
-            assert len(topology.neighbors_of(pid)) == 1
-            assert topology.neighbors_of(pid) == ProcessSet({Pid((pid.id % 3) + 1)})
-
-    def test_arbitrary_undirected_ring_from_tuples(self) -> None:
-        """Test Arbitrary topology with undirected ring from tuples."""
-        processes = ProcessSet({Pid(1), Pid(2), Pid(3)})
-        channels = [
-            (Pid(1), Pid(2)),
-            (Pid(2), Pid(3)),
-            (Pid(3), Pid(1)),
-        ]
-        topology: NetworkTopology = Arbitrary.from_(channels, directed=False)
-        assert_valid_topology(topology, 3, processes)
-        assert_valid_ring(topology, 3, processes)
-
-    def test_arbitrary_undirected_ring_from_channels(self) -> None:
-        """Test Arbitrary topology with undirected ring from Channel objects."""
-        processes = ProcessSet({Pid(1), Pid(2), Pid(3)})
-        channels = [
-            Channel(Pid(1), Pid(2)),
-            Channel(Pid(2), Pid(3)),
-            Channel(Pid(3), Pid(1)),
-        ]
-        topology: NetworkTopology = Arbitrary.from_(channels, directed=False)
-        assert_valid_topology(topology, 3, processes)
-        assert_valid_ring(topology, 3, processes)
-
-    def test_arbitrary_undirected_ring_from_mixed_objects(self) -> None:
-        """Test Arbitrary topology with mixed object types (Pid, tuples, Channels)."""
-        processes = ProcessSet({Pid(1), Pid(2), Pid(3)})
-        channels = [
-            Pid(1),
-            Pid(2),
-            Channel(Pid(1), Pid(2)),
-            (Pid(2), Pid(3)),
-            Channel(Pid(3), Pid(1)),
-        ]
-        topology: NetworkTopology = Arbitrary.from_(channels, directed=False)
-        assert_valid_topology(topology, 3, processes)
-        assert_valid_ring(topology, 3, processes)
+        if directed:
+            successor = {Pid(1): Pid(2), Pid(2): Pid(3), Pid(3): Pid(1)}
+            for pid in processes.processes:
+                assert topology.neighbors_of(pid) == ProcessSet(successor[pid])
+        else:
+            assert_valid_ring(topology, 3, processes)
     
\ No newline at end of file
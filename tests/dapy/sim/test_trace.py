@@ -3,9 +3,27 @@
 
 """Test suite for trace generation and serialization."""
 
+import io
+import pickletools
+import random
+
 from typing import Optional
 
-from dapy.sim import Trace
+from dapy.algo.learn import LearnGraphAlgorithm, Start
+from dapy.core import Pid, RandomSource, Ring, SimTime, SynchronyModel, System, simtime
+from dapy.sim import Settings, Simulator, Trace
+
+
+def _learn_trace_with_rng(system: System, seed: int) -> Trace:
+    """Run the learn algorithm on a system, drawing message delays from a seeded generator."""
+    sim = Simulator.from_system(
+        system, LearnGraphAlgorithm(system), settings=Settings(enable_trace=True), rng=random.Random(seed)
+    )
+    sim.start()
+    sim.schedule(event=Start(target=Pid(1)), at=simtime(seconds=0))
+    sim.run_to_completion()
+    assert sim.trace is not None
+    return sim.trace
 
 
 class TestTraceGeneration:
@@ -13,7 +31,6 @@ class TestTraceGeneration:
 
     def test_trace_properties(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
         """Test that generated trace has expected properties."""
-        from dapy.core import simtime
         trace = trace_from_learn_algorithm
         assert trace is not None
         assert trace.algorithm_name == "Learn the Topology"
@@ -23,27 +40,53 @@ class TestTraceGeneration:
         assert trace.history[0].time == simtime()
         assert trace.history[-1].time == simtime(seconds=3)
 
+    def test_trace_with_custom_synchrony_model(self) -> None:
+        """Test that a custom synchrony model runs and receives the simulator's generator."""
+        generator = random.Random(0)
+        
+        class FixedDelay(SynchronyModel):
+            def arrival_time_for(self, sent_at: SimTime, rng: Optional[RandomSource] = None) -> SimTime:
+                assert rng is generator
+                return SimTime(sent_at + simtime(seconds=1))
+        
+        system = System(topology=Ring.of_size(3), synchrony=FixedDelay())
+        sim = Simulator.from_system(
+            system, LearnGraphAlgorithm(system), settings=Settings(enable_trace=True), rng=generator
+        )
+        sim.start()
+        sim.schedule(event=Start(target=Pid(1)), at=simtime(seconds=0))
+        sim.run_to_completion()
+        assert sim.trace is not None
+        assert sim.trace.history[-1].time == simtime(seconds=3)
+
 
 class TestTraceSerialization:
     """Test suite for Trace serialization and deserialization."""
 
-    def test_trace_json_serialization(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+    def test_trace_json_serialization(
+        self, trace_from_learn_algorithm: Optional[Trace], trace_json_blob: str
+    ) -> None:
         """Test JSON serialization and deserialization of Trace."""
         original_trace = trace_from_learn_algorithm
         assert original_trace is not None
-        trace_json = original_trace.dump_json()
+        trace_json = trace_json_blob
         assert trace_json is not None
         assert isinstance(trace_json, str)
         
         # Deserialize from JSON
         restored_trace = Trace.load_json(trace_json)
         assert restored_trace == original_trace
+        
+        # Deserialize from UTF-8 encoded bytes, as read from a file
+        assert Trace.load_json(trace_json.encode('utf-8')) == original_trace
 
-    def test_trace_pickle_serialization(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+    def test_trace_pickle_serialization(
+        self, trace_from_learn_algorithm: Optional[Trace], trace_pickle_blob: bytes
+    ) -> None:
         """Test Pickle serialization and deserialization of Trace."""
         original_trace = trace_from_learn_algorithm
         assert original_trace is not None
-        trace_bytes = original_trace.dump_pickle()
+        trace_bytes = trace_pickle_blob
         assert trace_bytes is not None
         assert isinstance(trace_bytes, bytes)
         
@@ -51,13 +94,35 @@ class TestTraceSerialization:
         restored_trace = Trace.load_pickle(trace_bytes)
         assert restored_trace == original_trace
 
-    def test_trace_roundtrip_consistency(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+    def test_trace_write_pickle(
+        self, trace_from_learn_algorithm: Optional[Trace], trace_pickle_blob: bytes
+    ) -> None:
+        """Test that write_pickle() streams the same bytes as dump_pickle()."""
+        original_trace = trace_from_learn_algorithm
+        assert original_trace is not None
+        buffer = io.BytesIO()
+        original_trace.write_pickle(buffer)
+        assert buffer.getvalue() == trace_pickle_blob
+
+    def test_trace_pickle_protocol(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+        """Test that dump_pickle() honors the requested pickle protocol."""
+        original_trace = trace_from_learn_algorithm
+        assert original_trace is not None
+        for protocol in (4, 5):
+            trace_bytes = original_trace.dump_pickle(protocol=protocol)
+            opcode, arg, _ = next(pickletools.genops(trace_bytes))
+            assert (opcode.name, arg) == ("PROTO", protocol)
+            assert Trace.load_pickle(trace_bytes) == original_trace
+
+    def test_trace_roundtrip_consistency(
+        self, trace_from_learn_algorithm: Optional[Trace], trace_json_blob: str, trace_pickle_blob: bytes
+    ) -> None:
         """Test that JSON and Pickle serialization preserve trace equality."""
         original_trace = trace_from_learn_algorithm
         assert original_trace is not None
-        json_trace = Trace.load_json(original_trace.dump_json())
+        json_trace = Trace.load_json(trace_json_blob)
         # Test Pickle roundtrip
-        pickle_trace = Trace.load_pickle(original_trace.dump_pickle())
+        pickle_trace = Trace.load_pickle(trace_pickle_blob)
         
         # Both should be equal to original
         assert json_trace == original_trace
@@ -65,7 +130,9 @@ class TestTraceSerialization:
         # And equal to each other
         assert json_trace == pickle_trace
 
-    def test_trace_default_dump_load(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+    def test_trace_default_dump_load(
+        self, trace_from_learn_algorithm: Optional[Trace], trace_pickle_blob: bytes
+    ) -> None:
         """Test that dump() and load() default to pickle format."""
         original_trace = trace_from_learn_algorithm
         assert original_trace is not None
@@ -79,14 +146,16 @@ class TestTraceSerialization:
         assert restored_trace == original_trace
         
         # dump() should be equivalent to dump_pickle()
-        assert trace_data == original_trace.dump_pickle()
+        assert trace_data == trace_pickle_blob
 
-    def test_trace_json_is_prettified(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+    def test_trace_json_is_prettified(
+        self, trace_from_learn_algorithm: Optional[Trace], trace_json_blob: str
+    ) -> None:
         """Test that dump_json() produces indented, human-readable JSON."""
         original_trace = trace_from_learn_algorithm
         assert original_trace is not None
         
-        trace_json = original_trace.dump_json()
+        trace_json = trace_json_blob
         
         # Check for indentation (pretty print with 2 spaces)
         assert '\n' in trace_json  # Has newlines
@@ -95,3 +164,13 @@ class TestTraceSerialization:
         # Should still deserialize correctly
         restored_trace = Trace.load_json(trace_json)
         assert restored_trace == original_trace
+
+    def test_trace_with_seeded_rng_serialization(self, ring3_async_system: System) -> None:
+        """Test that a trace run with a seeded generator serializes without it and is reproducible."""
+        trace = _learn_trace_with_rng(ring3_async_system, seed=7)
+        assert trace == _learn_trace_with_rng(ring3_async_system, seed=7)
+        
+        trace_json = trace.dump_json()
+        assert '"rng"' not in trace_json
+        assert Trace.load_json(trace_json) == trace
+        assert Trace.load_pickle(trace.dump_pickle()) == trace
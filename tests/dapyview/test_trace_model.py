@@ -0,0 +1,34 @@
+# Copyright (c) 2025-2026 Xavier Defago
+# SPDX-License-Identifier: MIT
+
+"""Tests for TraceModel."""
+
+from typing import Optional
+
+from dapy.core import Pid
+from dapy.sim import Trace
+from dapyview.trace_model import TraceModel
+
+
+class TestTraceModelMessages:
+    """Test message queries on a trace model."""
+    
+    def test_messages_between(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+        """Test that messages are found in both directions between two processes."""
+        assert trace_from_learn_algorithm is not None
+        model = TraceModel(trace_from_learn_algorithm)
+        
+        expected = [
+            idx for idx, msg in enumerate(model.messages)
+            if {msg.sender, msg.receiver} == {Pid(1), Pid(2)}
+        ]
+        assert expected
+        assert model.get_messages_between(Pid(1), Pid(2)) == expected
+        assert model.get_messages_between(Pid(2), Pid(1)) == expected
+    
+    def test_messages_between_unrelated(self, trace_from_learn_algorithm: Optional[Trace]) -> None:
+        """Test that no messages are found for processes outside the trace."""
+        assert trace_from_learn_algorithm is not None
+        model = TraceModel(trace_from_learn_algorithm)
+        
+        assert model.get_messages_between(Pid(1), Pid(42)) == []
@@ -3,16 +3,57 @@
 
 """Tests for VectorClock implementation."""
 
+import operator
+
+import pytest
+
 from dapy.core import Pid
 from dapyview.trace_model import VectorClock
 
+# Process identifiers and sets shared by the tests (immutable, so safe to share)
+PIDS = (Pid(0), Pid(1), Pid(2))
+PROCS2 = frozenset(PIDS[:2])
+PROCS3 = frozenset(PIDS)
+
+
+def _vc(*values: int) -> VectorClock:
+    """Create a vector clock with the given values for the first processes of PIDS."""
+    procs = PIDS[:len(values)]
+    return VectorClock.create(frozenset(procs), dict(zip(procs, values)))
+
+
+@pytest.fixture(scope="module")
+def vc_12() -> VectorClock:
+    """Vector clock [1, 2] over two processes, shared by the module (clocks are immutable)."""
+    return _vc(1, 2)
+
+
+@pytest.fixture(scope="module")
+def vc_23() -> VectorClock:
+    """Vector clock [2, 3] over two processes, shared by the module (clocks are immutable)."""
+    return _vc(2, 3)
+
+
+@pytest.fixture(scope="module")
+def clocks(vc_12: VectorClock, vc_23: VectorClock) -> dict[str, VectorClock]:
+    """Clocks compared by the comparison tests, by name (equal clocks are distinct instances)."""
+    return {
+        "12": vc_12,
+        "12_eq": _vc(1, 2),
+        "13": _vc(1, 3),
+        "23": vc_23,
+        "120": _vc(1, 2, 0),
+        "120_eq": _vc(1, 2, 0),
+        "231": _vc(2, 3, 1),
+    }
+
 
 class TestVectorClockBasics:
     """Test basic VectorClock operations."""
     
     def test_create_empty(self) -> None:
         """Test creating a vector clock with all zeros."""
-        processes = {Pid(0), Pid(1), Pid(2)}
+        processes = PROCS3
         vc = VectorClock.create(processes)
         
         assert vc.to_dict() == {Pid(0): 0, Pid(1): 0, Pid(2): 0}
@@ -20,7 +61,7 @@ class TestVectorClockBasics:
     
     def test_create_with_initial_values(self) -> None:
         """Test creating a vector clock with initial values."""
-        processes = {Pid(0), Pid(1), Pid(2)}
+        processes = PROCS3
         initial = {Pid(0): 1, Pid(1): 2, Pid(2): 3}
         vc = VectorClock.create(processes, initial)
         
@@ -29,7 +70,7 @@ class TestVectorClockBasics:
     
     def test_increment(self) -> None:
         """Test incrementing a component."""
-        processes = {Pid(0), Pid(1), Pid(2)}
+        processes = PROCS3
         vc = VectorClock.create(processes)
         
         vc1 = vc.increment(Pid(0))
@@ -43,7 +84,7 @@ class TestVectorClockBasics:
     
     def test_immutability(self) -> None:
         """Test that vector clocks are immutable."""
-        processes = {Pid(0), Pid(1)}
+        processes = PROCS2
         vc = VectorClock.create(processes)
         vc_incremented = vc.increment(Pid(0))
         
@@ -54,8 +95,7 @@ class TestVectorClockBasics:
     
     def test_copy(self) -> None:
         """Test copying a vector clock."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 5, Pid(1): 3})
+        vc1 = _vc(5, 3)
         vc2 = vc1.copy()
         
         assert vc1.to_dict() == vc2.to_dict()
@@ -69,27 +109,24 @@ class TestVectorClockMerge:
     
     def test_merge_basic(self) -> None:
         """Test basic merge operation."""
-        processes = {Pid(0), Pid(1), Pid(2)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2, Pid(2): 0})
-        vc2 = VectorClock.create(processes, {Pid(0): 0, Pid(1): 1, Pid(2): 3})
+        vc1 = _vc(1, 2, 0)
+        vc2 = _vc(0, 1, 3)
         
         merged = vc1.merge(vc2)
         assert merged.to_dict() == {Pid(0): 1, Pid(1): 2, Pid(2): 3}
     
     def test_merge_identical(self) -> None:
         """Test merging identical clocks."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 5, Pid(1): 3})
-        vc2 = VectorClock.create(processes, {Pid(0): 5, Pid(1): 3})
+        vc1 = _vc(5, 3)
+        vc2 = _vc(5, 3)
         
         merged = vc1.merge(vc2)
         assert merged.to_dict() == {Pid(0): 5, Pid(1): 3}
     
     def test_merge_immutability(self) -> None:
         """Test that merge doesn't modify original clocks."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 0})
-        vc2 = VectorClock.create(processes, {Pid(0): 0, Pid(1): 2})
+        vc1 = _vc(1, 0)
+        vc2 = _vc(0, 2)
         
         merged = vc1.merge(vc2)
         
@@ -103,57 +140,32 @@ class TestVectorClockMerge:
 class TestVectorClockComparisons:
     """Test vector clock comparison operators."""
     
-    def test_equality(self) -> None:
-        """Test equality comparison."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        vc2 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        vc3 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 3})
-        
-        assert vc1 == vc2
-        assert not (vc1 == vc3)
-    
-    def test_less_than(self) -> None:
-        """Test less than (causal precedence)."""
-        processes = {Pid(0), Pid(1), Pid(2)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2, Pid(2): 0})
-        vc2 = VectorClock.create(processes, {Pid(0): 2, Pid(1): 3, Pid(2): 1})
-        vc3 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2, Pid(2): 0})
-        
-        assert vc1 < vc2  # vc1 causally precedes vc2
-        assert not (vc2 < vc1)  # vc2 does not precede vc1
-        assert not (vc1 < vc3)  # Equal clocks don't satisfy <
-    
-    def test_less_than_or_equal(self) -> None:
-        """Test less than or equal."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        vc2 = VectorClock.create(processes, {Pid(0): 2, Pid(1): 3})
-        vc3 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        
-        assert vc1 <= vc2
-        assert vc1 <= vc3  # Equal clocks satisfy <=
-        assert not (vc2 <= vc1)
-    
-    def test_greater_than(self) -> None:
-        """Test greater than."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        vc2 = VectorClock.create(processes, {Pid(0): 2, Pid(1): 3})
-        
-        assert vc2 > vc1
-        assert not (vc1 > vc2)
-    
-    def test_greater_than_or_equal(self) -> None:
-        """Test greater than or equal."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        vc2 = VectorClock.create(processes, {Pid(0): 2, Pid(1): 3})
-        vc3 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        
-        assert vc2 >= vc1
-        assert vc1 >= vc3  # Equal clocks satisfy >=
-        assert not (vc1 >= vc2)
+    @pytest.mark.parametrize(
+        ("x", "op", "y", "expected"),
+        [
+            # Equality
+            ("12", "eq", "12_eq", True),
+            ("12", "eq", "13", False),
+            # Less than (causal precedence); equal clocks don't satisfy <
+            ("120", "lt", "231", True),
+            ("231", "lt", "120", False),
+            ("120", "lt", "120_eq", False),
+            # Less than or equal; equal clocks satisfy <=
+            ("12", "le", "23", True),
+            ("12", "le", "12_eq", True),
+            ("23", "le", "12", False),
+            # Greater than
+            ("23", "gt", "12", True),
+            ("12", "gt", "23", False),
+            # Greater than or equal; equal clocks satisfy >=
+            ("23", "ge", "12", True),
+            ("12", "ge", "12_eq", True),
+            ("12", "ge", "23", False),
+        ],
+    )
+    def test_comparison(self, clocks: dict[str, VectorClock], x: str, op: str, y: str, expected: bool) -> None:
+        """Test comparison operators."""
+        assert getattr(operator, op)(clocks[x], clocks[y]) is expected
 
 
 class TestVectorClockConcurrency:
@@ -161,29 +173,26 @@ class TestVectorClockConcurrency:
     
     def test_concurrent_events(self) -> None:
         """Test detection of concurrent events."""
-        processes = {Pid(0), Pid(1), Pid(2)}
         # Event at P0: [1, 0, 0]
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 0, Pid(2): 0})
+        vc1 = _vc(1, 0, 0)
         # Event at P1: [0, 1, 0]
-        vc2 = VectorClock.create(processes, {Pid(0): 0, Pid(1): 1, Pid(2): 0})
+        vc2 = _vc(0, 1, 0)
         
         assert vc1.is_concurrent_with(vc2)
         assert vc2.is_concurrent_with(vc1)
     
     def test_not_concurrent_causal(self) -> None:
         """Test that causally related events are not concurrent."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 0})
-        vc2 = VectorClock.create(processes, {Pid(0): 2, Pid(1): 1})
+        vc1 = _vc(1, 0)
+        vc2 = _vc(2, 1)
         
         assert not vc1.is_concurrent_with(vc2)
         assert not vc2.is_concurrent_with(vc1)
     
-    def test_not_concurrent_equal(self) -> None:
+    def test_not_concurrent_equal(self, vc_12: VectorClock) -> None:
         """Test that equal clocks are not concurrent."""
-        processes = {Pid(0), Pid(1)}
-        vc1 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        vc2 = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
+        vc1 = vc_12
+        vc2 = _vc(1, 2)
         
         assert not vc1.is_concurrent_with(vc2)
 
@@ -193,7 +202,7 @@ class TestVectorClockScenarios:
     
     def test_message_passing_scenario(self) -> None:
         """Test Fidge-Mattern algorithm for message passing."""
-        processes = {Pid(0), Pid(1)}
+        processes = PROCS2
         
         # Initial state
         vc_p0 = VectorClock.create(processes)
@@ -208,13 +217,13 @@ class TestVectorClockScenarios:
         assert vc_p1.to_dict() == {Pid(0): 1, Pid(1): 1}
         
         # Verify causality: send happened before receive
-        send_vc = VectorClock.create(processes, {Pid(0): 1, Pid(1): 0})
-        receive_vc = VectorClock.create(processes, {Pid(0): 1, Pid(1): 1})
+        send_vc = _vc(1, 0)
+        receive_vc = _vc(1, 1)
         assert send_vc < receive_vc
     
     def test_three_process_scenario(self) -> None:
         """Test three-process communication scenario."""
-        processes = {Pid(0), Pid(1), Pid(2)}
+        processes = PROCS3
         
         vc_p0 = VectorClock.create(processes)
         vc_p1 = VectorClock.create(processes)
@@ -247,17 +256,13 @@ class TestVectorClockScenarios:
     
     def test_lamport_conversion(self) -> None:
         """Test conversion to Lamport-like scalar clock."""
-        processes = {Pid(0), Pid(1), Pid(2)}
-        vc = VectorClock.create(processes, {Pid(0): 3, Pid(1): 5, Pid(2): 2})
+        vc = _vc(3, 5, 2)
         
         assert vc.to_lamport() == 10  # Sum of all components
     
-    def test_repr(self) -> None:
+    def test_repr(self, vc_12: VectorClock) -> None:
         """Test string representation."""
-        processes = {Pid(0), Pid(1)}
-        vc = VectorClock.create(processes, {Pid(0): 1, Pid(1): 2})
-        
-        repr_str = repr(vc)
+        repr_str = repr(vc_12)
         assert "VectorClock" in repr_str
         assert "Pid(0)" in repr_str or "0" in repr_str
         assert "1" in repr_str